@@ -2,26 +2,533 @@
 
 import os
 import re
+import argparse
 import sys
 import json
+import mmap
+import time
+import hashlib
+import functools
+import itertools
 import networkx as nx
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from networkx.readwrite import json_graph
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Any
+
+try:
+    # RE2 matches in time linear in the input, so no pattern can backtrack
+    # catastrophically on minified or adversarial source.
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+try:
+    # orjson parses lock files and serializes the graph several times faster.
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Parse JSON from bytes.
+_json_loads = _orjson.loads if _orjson is not None else json.loads
+
+
+def _json_dumps(obj, pretty: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes, with orjson when it is installed.
+
+    Output is compact unless ``pretty``, which indents by two spaces.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _write_records(f, records):
+    """Write an iterable of JSON records as an array, one record per line."""
+    f.write(b"[")
+    separator = b"\n"
+    for record in records:
+        f.write(separator)
+        f.write(_json_dumps(record))
+        separator = b",\n"
+    f.write(b"\n]")
+
+
+def _compile(pattern: bytes, flags: int = 0):
+    """Compile a source scanning pattern, with RE2 when it is installed.
+
+    RE2 takes flags inline, so DOTALL and MULTILINE are passed as ``(?s)``
+    and ``(?m)``. Patterns (or flags) RE2 does not support fall back to the
+    standard library engine.
+    """
+    if _re2 is not None and not flags & ~(re.DOTALL | re.MULTILINE):
+        options = _re2.Options()
+        options.log_errors = False
+        prefix = b"(?s)" if flags & re.DOTALL else b""
+        prefix += b"(?m)" if flags & re.MULTILINE else b""
+        try:
+            return _re2.compile(prefix + pattern, options)
+        except _re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+
+def _union(patterns, flags=0):
+    """Combine bytes patterns into a single alternation of named groups g0, g1, ...
+
+    Returns the compiled union and, per alternative, the slice of
+    ``match.groups()`` holding that alternative's own capturing groups.
+    """
+    parts = []
+    spans = []
+    offset = 0
+    for i, pattern in enumerate(patterns):
+        n_groups = re.compile(pattern).groups
+        parts.append(b"(?P<g%d>%s)" % (i, pattern))
+        spans.append(slice(offset + 1, offset + 1 + n_groups))
+        offset += n_groups + 1
+    return _compile(b"|".join(parts), flags), spans
+
+
+def _decode(value: Optional[bytes]) -> Optional[str]:
+    """Decode a captured group of the (bytes) source text."""
+    return value.decode("utf-8", "replace") if value is not None else None
+
+
+def _label(prefix: str, name: str) -> str:
+    """Build an interned node label for names that recur across many files."""
+    return sys.intern(prefix + name)
+
+
+def _alternative(match, spans):
+    """Return the index of the union alternative that matched and its groups."""
+    index = int(match.lastgroup[1:])
+    return index, match.groups()[spans[index]]
+
+
+def _find_declarations(content: bytes, passes, union=None) -> List[Tuple[int, Tuple, bool]]:
+    """Find declarations in order of appearance, from separate passes and a union.
+
+    ``passes`` pairs the index of a pattern with its own compiled pattern.
+    ``union``, if given, is the compiled union of the remaining patterns, its
+    spans and the index of each of its alternatives. Returns, per
+    declaration, the index of the pattern that matched, its groups and
+    whether the match includes ``export``. A declaration matched by several
+    patterns is taken from the first of them, as identified by the position
+    of its name.
+    """
+    found: Dict[int, Tuple[int, int, Tuple, bool]] = {}
+
+    def add(index: int, match, groups: Tuple, name_start: int):
+        current = found.get(name_start)
+        if current is None or index < current[1]:
+            found[name_start] = (match.start(), index, groups, match.group(0).find(b'export') != -1)
+
+    for index, pattern in passes:
+        for match in pattern.finditer(content):
+            add(index, match, match.groups(), match.start(1))
+    if union is not None:
+        union_re, spans, union_indices = union
+        for match in union_re.finditer(content):
+            alternative, groups = _alternative(match, spans)
+            # The union's groups() index i is group number i + 1.
+            add(union_indices[alternative], match, groups, match.start(spans[alternative].start + 1))
+
+    return [
+        (index, groups, exported)
+        for _, index, groups, exported in sorted(found.values(), key=lambda item: item[:2])
+    ]
+
+
+def _find_classes(content: bytes) -> List[Tuple[int, Tuple, bool]]:
+    """Find class, interface and type alias declarations; see ``_find_declarations``."""
+    return _find_declarations(content, _CLASS_RES)
+
+
+def _find_functions(content: bytes) -> List[Tuple[int, Tuple, bool]]:
+    """Find standalone function declarations; see ``_find_declarations``."""
+    return _find_declarations(
+        content, _SPANNING_FUNCTION_RES, (_FUNCTION_RE, _FUNCTION_SPANS, _FUNCTION_UNION_INDICES)
+    )
+
+
+# The source scanning patterns below are bytes patterns: files are read as
+# bytes and only the captured groups are decoded.
+
+# The inside of an import or export binding list, e.g. "a, type B, c as d,".
+# It may span lines but, unlike [^}]*, cannot run on from a stray "import {"
+# over a comment or into the next statement.
+_BINDING = rb'(?:type\s+)?\w+(?:\s+as\s+\w+)?'
+_BINDING_LIST = rb'\s*(?:' + _BINDING + rb'\s*(?:,\s*' + _BINDING + rb'\s*)*,?\s*)?'
+
+# Import statements, scanned over the whole file so that statements spanning
+# several lines need no reassembly. Only the first alternative binds names.
+_IMPORT_RE, _IMPORT_SPANS = _union((
+    # Static imports: default, namespace and/or destructured bindings.
+    rb'\bimport\b\s*(?:type\s+)?(?:(\w+)\s*,?\s*)?(?:\*\s*as\s+(\w+)\s*|{(' + _BINDING_LIST + rb')}\s*)?from\s*[\'"]([^\'"]+)[\'"]',
+    # Side effect imports.
+    rb'\bimport\s*[\'"]([^\'"]+)[\'"]',
+    # Dynamic imports.
+    rb'\bimport\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)',
+    # Re-exports.
+    rb'\bexport\s*(?:\*(?:\s*as\s+\w+)?|{' + _BINDING_LIST + rb'})\s*from\s*[\'"]([^\'"]+)[\'"]',
+    # Require statements, including export equals.
+    rb'\brequire\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)',
+))
+
+# Names inside a destructured import list, without inline type modifiers.
+_DESTRUCTURED_NAME_RE = _compile(rb'(?:type\s+)?(\w+)(?:\s+as\s+\w+)?')
+
+# Class-like declaration patterns. The React variants come first so that a
+# component class is tagged as such rather than as a plain class.
+_CLASS_ALTERNATIVES = (
+    # React components as classes.
+    (rb'(?:export\s+)?class\s+(\w+)\s+extends\s+(?:React\.)?Component\s*[^{]*{([^}]*)}', True),
+    # Pure components.
+    (rb'(?:export\s+)?class\s+(\w+)\s+extends\s+(?:React\.)?PureComponent\s*[^{]*{([^}]*)}', True),
+    # Regular classes.
+    (rb'(?:export\s+)?(?:abstract\s+)?class\s+(\w+)(?:\s+extends\s+[^{]+)?\s*{([^}]*)}', False),
+    # Interfaces.
+    (rb'(?:export\s+)?interface\s+(\w+)(?:\s+extends\s+[^{]+)?\s*{([^}]*)}', False),
+    # Type aliases.
+    (rb'(?:export\s+)?type\s+(\w+)\s*=\s*{([^}]*)}', False),
+)
+
+# Extends clauses and bodies can reach into later declarations, so each
+# pattern is scanned on its own pass rather than in a union.
+_CLASS_RES = [(i, _compile(p, re.DOTALL)) for i, (p, _) in enumerate(_CLASS_ALTERNATIVES)]
+_CLASS_IS_REACT = [is_react for _, is_react in _CLASS_ALTERNATIVES]
+
+# Method declarations inside a class body.
+_METHOD_RE = _compile(
+    rb'(?:async\s+)?'                           # async modifier
+    rb'(?:static\s+)?'                          # static modifier
+    rb'(?:private\s+|protected\s+|public\s+)?'  # access modifiers
+    rb'(?:get\s+|set\s+)?'                      # getter/setter
+    rb'(\w+)'                                   # method name
+    rb'\s*'
+    rb'(?:<[^>]*>)?'                            # generic type parameters
+    rb'\s*'
+    rb'\((.*?)\)'                               # parameters
+    rb'(?:\s*:\s*([^{;]*))?'                    # return type
+)
+
+# Standalone function patterns including React hooks and components, in order
+# of precedence when several match the same declaration.
+_FUNCTION_PATTERNS = (
+    # Regular functions.
+    rb'(?:export\s+)?(?:async\s+)?function\s*(?:<[^>]*>)?\s*(\w+)\s*\((.*?)\)(?:\s*:\s*([^{;]*))?',
+    # Arrow functions with explicit type.
+    rb'(?:export\s+)?(?:const|let|var)\s+(\w+)\s*:\s*(?:React\.)?(?:FC|FunctionComponent|ComponentType)[^=]*=\s*(?:async\s*)?\((.*?)\)(?:\s*:\s*([^{;]*))?',
+    # Arrow functions.
+    rb'(?:export\s+)?(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s*)?\((.*?)\)(?:\s*:\s*([^{;]*))?\s*=>',
+    # React components.
+    rb'(?:export\s+)?(?:const|let|var)\s+(\w+)\s*=\s*React\.memo\(',
+    # React forwardRef.
+    rb'(?:export\s+)?(?:const|let|var)\s+(\w+)\s*=\s*React\.forwardRef\(',
+    # Custom hooks.
+    rb'(?:export\s+)?(?:function|const|let|var)\s+(use\w+)',
+    # Higher-order components.
+    rb'(?:export\s+)?(?:const|let|var)\s+(\w+)\s*=\s*with\w+\(',
+)
+
+# Candidates for the regular and the two arrow function patterns can run far
+# past the declaration they start at: the return type up to the next "{" or
+# ";", the arrow type up to the next "=", the lazy parameters up to the next
+# ")" or "=>". In a shared union such a span would hide every other
+# declaration inside it, so these are scanned on their own. The remaining
+# patterns end at a fixed token after the name and share one union.
+_SPANNING_FUNCTIONS = (0, 1, 2)
+_FUNCTION_UNION_INDICES = [i for i in range(len(_FUNCTION_PATTERNS)) if i not in _SPANNING_FUNCTIONS]
+_FUNCTION_RE, _FUNCTION_SPANS = _union([_FUNCTION_PATTERNS[i] for i in _FUNCTION_UNION_INDICES], re.DOTALL)
+_SPANNING_FUNCTION_RES = [(i, _compile(_FUNCTION_PATTERNS[i], re.DOTALL)) for i in _SPANNING_FUNCTIONS]
+
+# Method calls, used to tell calls apart from function definitions.
+_CALL_PATTERN = rb'\.\s*(\w+)\s*\('
+_CALL_RE = _compile(_CALL_PATTERN)
+
+# JSX component usage.
+_JSX_PATTERN = rb'<([A-Z]\w+)(?:\s+(?:{[^}]*}|"[^"]*"|\'[^\']*\'|[^>])*)?/?>'
+
+# React hook calls.
+_HOOK_PATTERN = rb'(use\w+)\s*\('
+_HOOK_RE = _compile(_HOOK_PATTERN)
+
+# Usage tokens (method calls, JSX components, hook calls) found in one pass.
+# They start with distinct characters, so a match only ever hides the hooks
+# and method calls nested inside it, which are recovered from its text.
+_USAGE_RE, _USAGE_SPANS = _union((_CALL_PATTERN, _JSX_PATTERN, _HOOK_PATTERN))
+_USAGE_CALL, _USAGE_JSX, _USAGE_HOOK = range(3)
+
+# Parameter type annotations and default values.
+_PARAM_TYPE_RE = re.compile(r'(?:readonly\s+)?(\w+)\s*(?:\?|!)?:\s*([^=]+)')
+_PARAM_DEFAULT_RE = re.compile(r'(\w+)\s*=\s*(.+)')
+
+# Characters that matter when splitting a parameter list: brackets and commas.
+_PARAM_TOKEN_RE = re.compile(r'[,{}\[\]()]')
+
+# Package names in yarn.lock entry headers, with the start of their first
+# descriptor, e.g. "@scope/name@^1.0.0", name@^2: (v1) or "name@npm:^1.0.0":
+# (berry). Berry also lists the project's own workspaces, as
+# "app@workspace:.", which are not dependencies.
+_YARN_LOCK_RE = _compile(rb'^"?(@?[^@\s"]+)@([^\s"]*)', re.MULTILINE)
+
+# The packages: section of pnpm-lock.yaml runs up to the next top-level key.
+# Only its keys name packages; those under importers: are workspace paths,
+# e.g. "  apps/web:".
+_PNPM_PACKAGES_RE = _compile(rb'^packages:[ \t]*\r?$', re.MULTILINE)
+_YAML_TOP_LEVEL_KEY_RE = _compile(rb'^[^\s#]', re.MULTILINE)
+
+# Package keys in that section, e.g. /name/1.0.0 (v5), /name@1.0.0 (v6)
+# or '@scope/name@1.0.0' (v9).
+_PNPM_LOCK_RE = _compile(rb"^  '?/?((?:@[^@/\s']+/)?[^@/\s':]+)[@/]", re.MULTILINE)
+
+# Export patterns: (compiled pattern, is re-export).
+_EXPORT_PATTERNS = [(_compile(p), is_reexport) for p, is_reexport in (
+    # Named exports.
+    (rb'export\s+(?:const|let|var|function|class)\s+(\w+)', False),
+    # Default exports.
+    (rb'export\s+default\s+(?:class\s+)?(\w+)', False),
+    # Named exports list.
+    (rb'export\s*{\s*((?:\w+(?:\s+as\s+\w+)?(?:\s*,\s*)?)+)\s*}', False),
+    # Re-exports.
+    (rb'export\s*\*\s*from\s*[\'"]([^\'"]+)[\'"]', True),
+    # Type exports.
+    (rb'export\s+type\s+(\w+)', False),
+    # Export functions (e.g., export function funcName() {})
+    (rb'export\s+function\s+(\w+)\s*\(', False),
+)]
+
+
+# Statistics counters accumulated per file and summed when merging results.
+_FILE_COUNTERS = (
+    "total_classes",
+    "total_functions",
+    "total_components",
+    "total_hooks",
+    "total_imports",
+    "total_exports",
+)
+
+# Extensions of the source files to analyze.
+_SOURCE_EXTENSIONS = (".js", ".ts", ".jsx", ".tsx", ".d.ts")
+
+
+def _parse_package_json(content: bytes) -> Tuple[List[str], str]:
+    """Return the dependencies and devDependencies of a package.json."""
+    data = _json_loads(content)
+    dependencies = data.get("dependencies", {})
+    dev_dependencies = data.get("devDependencies", {})
+
+    # A package in both is repeated; adding its node and edge is idempotent.
+    return list(itertools.chain(dependencies, dev_dependencies)), "HAS_DEPENDENCY"
+
+
+def _parse_package_lock(content: bytes) -> Tuple[List[str], str]:
+    """Return the packages locked by a package-lock.json."""
+    data = _json_loads(content)
+    return list(data.get("dependencies", {})), "HAS_LOCKED_DEPENDENCY"
+
+
+def _parse_yarn_lock(content: bytes) -> Tuple[List[str], str]:
+    """Return the packages of a yarn.lock, read off its entry headers.
+
+    Only the package names are needed, so no YAML parser is involved.
+    """
+    return list(dict.fromkeys(
+        _decode(name)
+        for name, descriptor in _YARN_LOCK_RE.findall(content)
+        if not descriptor.startswith(b"workspace:")
+    )), "HAS_LOCKED_DEPENDENCY"
+
+
+def _parse_pnpm_lock(content: bytes) -> Tuple[List[str], str]:
+    """Return the packages of a pnpm-lock.yaml, read off the keys of its packages: section.
+
+    Only the package names are needed, so no YAML parser is involved.
+    """
+    section = _PNPM_PACKAGES_RE.search(content)
+    if section is None:
+        return [], "HAS_LOCKED_DEPENDENCY"
+    end = _YAML_TOP_LEVEL_KEY_RE.search(content, section.end())
+    names = _PNPM_LOCK_RE.findall(content, section.end(), end.start() if end else len(content))
+    return list(dict.fromkeys(map(_decode, names))), "HAS_LOCKED_DEPENDENCY"
+
+
+# Package manifests and lock files to extract dependencies from, by file name,
+# with the parser returning the dependencies they name and their relation.
+_DEPENDENCY_PARSERS = {
+    "package.json": _parse_package_json,
+    "package-lock.json": _parse_package_lock,
+    "yarn.lock": _parse_yarn_lock,
+    "pnpm-lock.yaml": _parse_pnpm_lock,
+}
+
+# Source files larger than this, or whose first line is longer than this,
+# are treated as generated code and skipped. Scanning them dominates run time
+# and risks pathological regex backtracking.
+_MAX_FILE_BYTES = 1024 * 1024
+_MAX_LINE_LENGTH = 5000
+
+# Source files of at least this size are memory-mapped instead of read.
+_MMAP_MIN_BYTES = 64 * 1024
+
+# Byte order mark stripped from the start of UTF-8 source files.
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+# Minimum number of seconds between two progress updates.
+_PROGRESS_INTERVAL = 0.05
+
+# Shared empty set for membership tests against missing map entries.
+_EMPTY_SET: frozenset = frozenset()
+
+# Below this many source files the process pool costs more than it saves.
+_PARALLEL_MIN_FILES = 64
+
+# Threads reading files ahead of their analysis in this process, and how
+# many files they may run ahead of it. Fewer files than _PREFETCH_MIN_FILES
+# are read in place, as starting the threads would cost more than it saves.
+_PREFETCH_THREADS = min(32, (os.cpu_count() or 1) * 4)
+_PREFETCH_DEPTH = 64
+_PREFETCH_MIN_FILES = 16
+
+# Buffer size for writing graph files, which are many small records.
+_WRITE_BUFFER_BYTES = 1 << 20
+
+# Graphs with more nodes than this are exported as GraphML instead of drawn.
+_MAX_DRAWN_NODES = 500
+
+
+class FileResult(NamedTuple):
+    """Graph fragment and bookkeeping produced by analyzing a single file."""
+    file_path: str
+    node_labels: List[str]
+    node_types: List[str]
+    node_attrs: List[Dict[str, Any]]
+    edges: Dict[int, Dict[int, int]]
+    relations: List[str]
+    counters: Dict[str, int]
+    dependencies: Set[str]
+    function_params: Dict[str, List[Dict[str, Any]]]
+    function_returns: Dict[str, str]
+    class_methods: Dict[str, Set[str]]
+    exports_map: Dict[str, Set[str]]
+    imported_entities: List[Tuple[str, str, str]]
+
+
+def _read_source(file_path: str) -> Optional[bytes]:
+    """Read a source file ahead of its analysis.
+
+    Returns None for files `_process_file` handles without a plain read
+    (too large, memory-mapped, unreadable); it then opens them itself.
+    """
+    try:
+        size = os.path.getsize(file_path)
+        if size > _MAX_FILE_BYTES or (size >= _MMAP_MIN_BYTES and _re2 is None):
+            return None
+        with open(file_path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _read_dependency(file_path: str) -> Optional[bytes]:
+    """Read a dependency file ahead of its processing, or return None if it cannot be."""
+    try:
+        with open(file_path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _prefetch(file_paths: List[str], read) -> Iterator[Tuple[str, Optional[bytes]]]:
+    """Yield each file path with ``read(path)``, in order, reading ahead on threads.
+
+    Waiting on the disk then overlaps with processing the files already read.
+    Below _PREFETCH_MIN_FILES files the content is None, for the caller to
+    read the file itself.
+    """
+    if len(file_paths) < _PREFETCH_MIN_FILES:
+        for file_path in file_paths:
+            yield file_path, None
+        return
+
+    with ThreadPoolExecutor(max_workers=_PREFETCH_THREADS) as executor:
+        remaining = iter(file_paths)
+        pending = deque(
+            (file_path, executor.submit(read, file_path))
+            for file_path in itertools.islice(remaining, _PREFETCH_DEPTH)
+        )
+        while pending:
+            file_path, content = pending.popleft()
+            for next_path in itertools.islice(remaining, 1):
+                pending.append((next_path, executor.submit(read, next_path)))
+            yield file_path, content.result()
+
+
+# Import resolutions and directory listings shared by every analyzer created
+# in a worker process.
+_worker_resolve_cache: Dict[Tuple[str, str], Optional[str]] = {}
+_worker_dir_files_cache: Dict[str, frozenset] = {}
+
+
+def _analyze_file(directory: str, alias_map: Dict[str, str], ignored_directories: Set[str],
+                  file_path: str) -> FileResult:
+    """Analyze one source file in isolation, e.g. inside a worker process."""
+    analyzer = JSCodeKnowledgeGraph(directory)
+    analyzer.alias_map = alias_map
+    analyzer.ignored_directories = ignored_directories
+    analyzer._resolve_cache = _worker_resolve_cache
+    analyzer._dir_files_cache = _worker_dir_files_cache
+    analyzer._process_file(file_path)
+    return FileResult(
+        file_path=file_path,
+        node_labels=analyzer._node_labels,
+        node_types=analyzer._node_types,
+        node_attrs=analyzer._node_attrs,
+        edges=analyzer._edges,
+        relations=analyzer._relations,
+        counters={name: getattr(analyzer, name) for name in _FILE_COUNTERS},
+        dependencies=analyzer.total_dependencies,
+        function_params=analyzer.function_params,
+        function_returns=analyzer.function_returns,
+        class_methods=analyzer.class_methods,
+        exports_map=analyzer.exports_map,
+        imported_entities=analyzer._imported_entities,
+    )
 
 
 class JSCodeKnowledgeGraph:
-    def __init__(self, directory: str):
+    def __init__(self, directory: str, max_workers: Optional[int] = None):
         """Initialize the knowledge graph generator.
 
         Args:
             directory: Root directory of the JavaScript/TypeScript codebase.
+            max_workers: Number of worker processes used to analyze files.
+                Defaults to the number of CPUs; 1 analyzes files serially.
         """
         self.directory = directory
-        self.graph = nx.DiGraph()
+        self.max_workers = max_workers
+        # Nodes are numbered in insertion order, with their label, type and
+        # remaining attributes held in parallel lists. Edges map a source
+        # node id to its target node ids, and those to the id of their
+        # relation. The NetworkX graph is only built from these when it is
+        # first needed, see `_nx_view`.
+        self._node_ids: Dict[str, int] = {}
+        self._node_labels: List[str] = []
+        self._node_types: List[str] = []
+        self._node_attrs: List[Dict[str, Any]] = []
+        self._edges: Dict[int, Dict[int, int]] = {}
+        self._relation_ids: Dict[str, int] = {}
+        self._relations: List[str] = []
+        self._graph: Optional[nx.DiGraph] = None
         self.class_methods: Dict[str, Set[str]] = {}
         self.function_params: Dict[str, List[Dict[str, Any]]] = {}
         self.function_returns: Dict[str, str] = {}
         self.files_processed = 0
+        self._last_progress = 0.0
         self.total_files = 0
         self.dirs_processed = 0
 
@@ -43,11 +550,24 @@ class JSCodeKnowledgeGraph:
         # Map exported entities to their defining files.
         self.exports_map: Dict[str, Set[str]] = {}
 
+        # Imported (entity, entity node, imported file) triples, linked to
+        # their defining files once every file has been analyzed.
+        self._imported_entities: List[Tuple[str, str, str]] = []
+
+        # Memoized import resolutions keyed by (importing directory, import path).
+        self._resolve_cache: Dict[Tuple[str, str], Optional[str]] = {}
+
+        # Names of the files in each probed directory.
+        self._dir_files_cache: Dict[str, frozenset] = {}
+        # Dependencies read from a dependency file, keyed by the digest of its
+        # contents and its name, so vendored or repeated copies parse once.
+        self._dependency_cache: Dict[Tuple[bytes, str], Tuple[List[str], str]] = {}
+
         # Directories to ignore during analysis.
         self.ignored_directories = set([
             'node_modules', 'build', 'dist', 'public', 'static', 'types', '.env', '.cache',
             'cache', '.next', 'coverage', '.results', 'results', 'screenshots', 'videos',
-            'tmp', 'temp', 'logs', 'out', 'aot', '.nuxt', 'migrations', 'static',
+            'tmp', 'temp', 'logs', 'out', 'aot', '.nuxt', 'migrations',
             'wwwroot', '.meteor', 'local', 'reports', 'docs', 'config', '.config', '.vscode',
             '.idea', '.git'
         ])
@@ -58,6 +578,11 @@ class JSCodeKnowledgeGraph:
             '.env',
         ])
 
+        # Suffixes of generated files (minified code, bundles) to ignore.
+        self.ignored_file_suffixes = (
+            '.min.js', '.min.ts', '.min.mjs', '.bundle.js', '.chunk.js',
+        )
+
         # For processing dependencies
         self.dependencies: Dict[str, Set[str]] = {}
 
@@ -74,183 +599,333 @@ class JSCodeKnowledgeGraph:
     def analyze_codebase(self):
         """Analyze the JavaScript/TypeScript codebase to extract files, imports,
         classes, methods, and their relationships."""
-        # First pass to count total files
         print("\nCounting files...")
-        for root, dirs, files in os.walk(self.directory):
-            # Remove ignored directories from dirs in-place to prevent walking into them
-            dirs[:] = [d for d in dirs if d not in self.ignored_directories]
-
-            # Skip if current directory is in node_modules or other ignored directories
-            if any(ignored in root.split(os.sep) for ignored in self.ignored_directories):
-                continue
-            dirs[:] = [d for d in dirs if d not in self.ignored_directories]
-            self.total_files += sum(1 for f in files if f not in self.ignored_files and f.endswith((".js", ".ts", ".jsx", ".tsx", ".d.ts")))
+        source_files, dependency_files = self._collect_files()
+        self.total_files = len(source_files)
 
-        print(f"Found {self.total_files} JavaScript/TypeScript files to process")
+        print(f"\nFound {self.total_files} JavaScript/TypeScript files to process")
         print("\nProcessing files...")
+        self._process_source_files(source_files)
+        for file_path, content in _prefetch(dependency_files, _read_dependency):
+            self._process_dependency_file(file_path, content)
+        self._link_imported_entities()
+
+        print(f"\n\nCompleted processing {self.files_processed} files across {self.dirs_processed} directories")
+
+    @property
+    def graph(self) -> nx.DiGraph:
+        """The knowledge graph as a NetworkX DiGraph, built on first access."""
+        return self._nx_view()
+
+    def _nx_view(self) -> nx.DiGraph:
+        """Build (once) the NetworkX DiGraph used by `save_graph` and `visualize_graph`."""
+        if self._graph is None:
+            labels = self._node_labels
+            relations = self._relations
+            graph = nx.DiGraph()
+            graph.add_nodes_from(
+                (label, {"type": node_type, **attrs})
+                for label, node_type, attrs in zip(labels, self._node_types, self._node_attrs)
+            )
+            graph.add_edges_from(
+                (labels[u], labels[v], {"relation": relations[relation]})
+                for u, v, relation in self._edge_ids()
+            )
+            self._graph = graph
+        return self._graph
+
+    def _node_id(self, node: str, node_type: str, attrs: Dict[str, Any]) -> int:
+        """Return the id of a node, adding it with these attributes if it is new."""
+        # One lookup: a new node takes the next id, which is then recorded.
+        node_id = self._node_ids.setdefault(node, len(self._node_labels))
+        if node_id == len(self._node_labels):
+            self._node_labels.append(node)
+            self._node_types.append(node_type)
+            self._node_attrs.append(attrs)
+            self._graph = None
+        return node_id
+
+    def _relation_id(self, relation: str) -> int:
+        """Return the id of an edge relation, numbering it if it is new."""
+        relation_id = self._relation_ids.get(relation)
+        if relation_id is None:
+            relation_id = self._relation_ids[relation] = len(self._relations)
+            self._relations.append(relation)
+        return relation_id
+
+    def _add_node(self, node: str, type: str, **attrs):
+        """Add a node unless it already exists, keeping its first attributes."""
+        self._node_id(node, type, attrs)
+
+    def _add_edge(self, source: str, target: str, relation: str):
+        """Add an edge between existing nodes.
+
+        Like DiGraph.add_edge, a repeated edge takes the latest relation.
+        """
+        node_ids = self._node_ids
+        self._edges.setdefault(node_ids[source], {})[node_ids[target]] = self._relation_id(relation)
+        self._graph = None
+
+    def _edge_ids(self):
+        """Yield (source, target, relation) ids per edge.
 
-        # Second pass to process files
-        for root, dirs, files in os.walk(self.directory):
-            # Remove ignored directories from dirs in-place to prevent walking into them
-            dirs[:] = [d for d in dirs if d not in self.ignored_directories]
+        Like DiGraph, edges are grouped by source node, in node order.
+        """
+        edges = self._edges
+        for u in range(len(self._node_labels)):
+            targets = edges.get(u)
+            if targets:
+                for v, relation in targets.items():
+                    yield u, v, relation
+
+    def _add_dependencies(self, file_node: str, dependencies, relation: str):
+        """Add dependency nodes and their edges from ``file_node`` in bulk."""
+        dependencies = list(dependencies)
+        node_id = self._node_id
+        dep_ids = [
+            node_id(_label("Dependency: ", dep), "dependency", {"name": dep})
+            for dep in dependencies
+        ]
+        file_id = self._node_ids[file_node]
+        relation_id = self._relation_id(relation)
+        self._edges.setdefault(file_id, {}).update((dep_id, relation_id) for dep_id in dep_ids)
+        self._graph = None
 
-            # Skip if current directory is in node_modules or other ignored directories
-            if any(ignored in root.split(os.sep) for ignored in self.ignored_directories):
+        self.total_dependencies.update(dependencies)
+
+    def _collect_files(self) -> Tuple[List[str], List[str]]:
+        """Walk the codebase once, returning its source and dependency files.
+
+        Uses an explicit stack of ``os.scandir`` listings so each entry's type
+        comes from the directory listing rather than a separate ``stat``.
+        Ignored directories are never descended into. Directories are visited
+        in the same top-down order as ``os.walk``.
+        """
+        source_files = []
+        dependency_files = []
+        stack = [self.directory]
+        while stack:
+            root = stack.pop()
+            try:
+                with os.scandir(root) as it:
+                    entries = list(it)
+            except OSError:
                 continue
 
-            # Display current directory
-            rel_path = os.path.relpath(root, self.directory)
+            # Display current directory, throttled like the file progress.
             self.dirs_processed += 1
-            print(f"\rProcessing directory [{self.dirs_processed}]: {rel_path}", end="")
-
-            for file in files:
-                if file in self.ignored_files:
+            now = time.monotonic()
+            if now - self._last_progress >= _PROGRESS_INTERVAL or not stack:
+                self._last_progress = now
+                rel_path = os.path.relpath(root, self.directory)
+                print(f"\rProcessing directory [{self.dirs_processed}]: {rel_path}", end="")
+
+            subdirs = []
+            for entry in entries:
+                name = entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # Like os.walk, list symlinked directories but don't follow them.
+                    if name not in self.ignored_directories and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif name in self.ignored_files or name.endswith(self.ignored_file_suffixes):
                     continue
-                if file.endswith((".js", ".ts", ".jsx", ".tsx", ".d.ts")):
-                    file_path = os.path.join(root, file)
-                    self._process_file(file_path)
-                elif file in ["package.json", "package-lock.json", "yarn.lock", "pnpm-lock.yaml"]:
-                    file_path = os.path.join(root, file)
-                    self._process_dependency_file(file_path)
+                elif name.endswith(_SOURCE_EXTENSIONS):
+                    source_files.append(entry.path)
+                elif name in _DEPENDENCY_PARSERS:
+                    dependency_files.append(entry.path)
 
-        print(f"\n\nCompleted processing {self.files_processed} files across {self.dirs_processed} directories")
+            stack.extend(reversed(subdirs))
 
-    def _process_file(self, file_path: str):
-        """Process a file to detect imports, classes, methods, and functions."""
-        if file_path in self.analyzed_files:
-            return
+        return source_files, dependency_files
 
-        try:
-            self.files_processed += 1
-            relative_path = os.path.relpath(file_path, self.directory)
-            print(f"\rProcessing file [{self.files_processed}/{self.total_files}]: {relative_path}", end="", flush=True)
+    def _process_source_files(self, file_paths: List[str]):
+        """Analyze source files, fanning out to worker processes for large codebases."""
+        file_paths = [p for p in file_paths if p not in self.analyzed_files]
+        workers = self.max_workers or os.cpu_count() or 1
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+        if workers == 1 or len(file_paths) < _PARALLEL_MIN_FILES:
+            for file_path, content in _prefetch(file_paths, _read_source):
+                self._report_progress(file_path)
+                self._process_file(file_path, content)
+            return
 
-            relative_path = os.path.relpath(file_path, self.directory)
-            file_node = f"File: {relative_path}"
+        worker = functools.partial(_analyze_file, self.directory, self.alias_map, self.ignored_directories)
+        chunksize = max(1, min(32, len(file_paths) // (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(worker, file_paths, chunksize=chunksize):
+                self._report_progress(result.file_path)
+                self._merge_file_result(result)
 
-            # Add to analyzed files set.
-            self.analyzed_files.add(file_path)
+    def _report_progress(self, file_path: str):
+        """Count a source file as processed and display progress.
 
-            # Add file node if it doesn't exist.
-            if not self.graph.has_node(file_node):
-                self.graph.add_node(file_node, type="file", path=relative_path)
+        The display is refreshed at most every _PROGRESS_INTERVAL seconds, and
+        for the last file, rather than with one write per file.
+        """
+        self.files_processed += 1
+        now = time.monotonic()
+        if now - self._last_progress < _PROGRESS_INTERVAL and self.files_processed < self.total_files:
+            return
+        self._last_progress = now
+        relative_path = os.path.relpath(file_path, self.directory)
+        print(f"\rProcessing file [{self.files_processed}/{self.total_files}]: {relative_path}", end="", flush=True)
+
+    def _merge_file_result(self, result: FileResult):
+        """Merge the graph fragment produced by a worker into this graph."""
+        self.analyzed_files.add(result.file_path)
+
+        # Renumber the worker's nodes and relations into this graph, keeping
+        # the attributes of the first occurrence as the serial path does.
+        node_id = self._node_id
+        node_ids = [
+            node_id(label, node_type, attrs)
+            for label, node_type, attrs in zip(result.node_labels, result.node_types, result.node_attrs)
+        ]
+        relation_ids = [self._relation_id(relation) for relation in result.relations]
+        edges = self._edges
+        for u, targets in result.edges.items():
+            edges.setdefault(node_ids[u], {}).update(
+                (node_ids[v], relation_ids[relation]) for v, relation in targets.items()
+            )
+        self._graph = None
+
+        for name, value in result.counters.items():
+            setattr(self, name, getattr(self, name) + value)
+        self.total_dependencies.update(result.dependencies)
+
+        self.function_params.update(result.function_params)
+        self.function_returns.update(result.function_returns)
+        for class_node, methods in result.class_methods.items():
+            self.class_methods.setdefault(class_node, set()).update(methods)
+        for file_node, exports in result.exports_map.items():
+            self.exports_map.setdefault(file_node, set()).update(exports)
+        self._imported_entities.extend(result.imported_entities)
+
+    def _link_imported_entities(self):
+        """Link imported entities to the files that export them."""
+        for entity, entity_node, imported_file in self._imported_entities:
+            if entity in (self.exports_map.get(imported_file) or _EMPTY_SET):
+                self._add_edge(entity_node, imported_file, "DEFINED_IN")
+
+    def _process_file(self, file_path: str, content: Optional[bytes] = None):
+        """Process a file to detect imports, classes, methods, and functions.
+
+        ``content`` is the file as already read by `_read_source`, if it was.
+        """
+        if file_path in self.analyzed_files:
+            return
 
-            # Process the file contents.
-            self._process_exports(content, file_node)
-            self._process_imports(content, file_node)
-            self._process_classes(content, file_node)
-            self._process_functions(content, file_node)
-            self._process_jsx_components(content, file_node)
-            self._process_hooks(content, file_node)
+        try:
+            if content is None:
+                # Skip files too large to be hand-written source.
+                size = os.path.getsize(file_path)
+                if size > _MAX_FILE_BYTES:
+                    return
+
+                with open(file_path, "rb") as f:
+                    # Large files are scanned straight from the page cache rather
+                    # than copied into a bytes object. RE2 needs real bytes.
+                    if size >= _MMAP_MIN_BYTES and _re2 is None:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                            self._process_content(content, file_path)
+                        return
+                    content = f.read()
+
+            if content.startswith(_UTF8_BOM):
+                content = content[len(_UTF8_BOM):]
+            self._process_content(content, file_path)
 
         except Exception as e:
             print(f"Error processing {file_path}: {str(e)}", file=sys.stderr)
 
-    def _process_imports(self, content: str, file_node: str):
-        """Process import statements in the content."""
-        import_patterns = [
-            # Destructured imports.
-            r'import\s*{([^}]*)}\s*from\s*[\'"]([^\'"]+)[\'"]',
-            # Default imports with optional destructuring.
-            r'import\s+(?:type\s+)?(\w+)\s*(?:,\s*{([^}]*)})?(?:\s*,\s*\*\s+as\s+\w+)?\s*from\s*[\'"]([^\'"]+)[\'"]',
-            # Namespace imports.
-            r'import\s*\*\s+as\s+(\w+)\s+from\s*[\'"]([^\'"]+)[\'"]',
-            # Side effect imports.
-            r'import\s*[\'"]([^\'"]+)[\'"]',
-            # Dynamic imports.
-            r'import\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)',
-            # Require statements.
-            r'(?:const|let|var)?\s*(?:{[^}]*})?\s*(?:[\w\s,{]*)\s*=\s*require\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)',
-            # Type imports.
-            r'import\s+type\s*{([^}]*)}\s*from\s*[\'"]([^\'"]+)[\'"]',
-            # Re-exports.
-            r'export\s*(?:\*|{[^}]*})\s*from\s*[\'"]([^\'"]+)[\'"]',
-            # Export equals.
-            r'export\s*=\s*require\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)',
-        ]
+    def _process_content(self, content: bytes, file_path: str):
+        """Process the contents of a source file.
 
-        # Handle multi-line imports.
-        lines = content.split('\n')
-        current_import = ""
-        all_imports = []
+        ``content`` is either bytes or a read-only mmap of the file, so it is
+        only searched with ``find`` and regexes, never ``in`` or slicing. A
+        BOM left at the start of an mmap is harmless to the unanchored patterns.
+        """
+        # Skip minified code: the first line alone runs past the limit.
+        if len(content) > _MAX_LINE_LENGTH and content.find(b"\n", 0, _MAX_LINE_LENGTH) == -1:
+            return
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        relative_path = os.path.relpath(file_path, self.directory)
+        file_node = f"File: {relative_path}"
 
-            if ('import' in line or 'require' in line or 'export' in line) and 'from' in line:
-                if (
-                    line.count('{') != line.count('}')
-                    or not any(c in line for c in [';', ')', '}'])
-                    or line.count('(') != line.count(')')
-                ):
-                    current_import = line
-                    continue
-                else:
-                    line_to_process = line
-            elif current_import:
-                current_import += " " + line
-                if (
-                    current_import.count('{') == current_import.count('}')
-                    and any(c in current_import for c in [';', ')', '}'])
-                    and current_import.count('(') == current_import.count(')')
-                ):
-                    line_to_process = current_import
-                    current_import = ""
-                else:
-                    continue
-            else:
-                continue
+        # Add to analyzed files set.
+        self.analyzed_files.add(file_path)
 
-            # Process the complete import statement.
-            for pattern in import_patterns:
-                matches = re.finditer(pattern, line_to_process, re.MULTILINE)
-                for match in matches:
-                    groups = match.groups()
-                    if not groups:
-                        continue
-
-                    import_entities = []
-                    # Get the import path (last group for most patterns).
-                    import_path = groups[-1]
-
-                    # Handle destructured imports.
-                    if "{" in line_to_process:
-                        destructured = next((g for g in groups if g and "{" in g), "")
-                        if destructured:
-                            # Process each destructured import.
-                            imports = re.findall(r'(\w+)(?:\s+as\s+\w+)?', destructured)
-                            import_entities.extend(imports)
-                    else:
-                        if groups[0]:
-                            import_entities.append(groups[0])
+        # Add file node if it doesn't exist.
+        self._add_node(file_node, type="file", path=relative_path)
+
+        # Process the file contents.
+        called, components, hooks = self._scan_usages(content)
+        self._process_exports(content, file_node)
+        self._process_imports(content, file_node)
+        self._process_classes(content, file_node)
+        self._process_functions(content, file_node, called)
+        self._process_jsx_components(components, file_node)
+        self._process_hooks(hooks, file_node)
 
-                    all_imports.append((import_entities, import_path))
+    def _scan_usages(self, content: bytes) -> Tuple[Set[bytes], List[bytes], List[bytes]]:
+        """Collect method call names, JSX components and hooks in one pass.
 
-        # Process all found imports.
-        for import_entities, imp in all_imports:
-            if not imp:
+        Components and hooks are returned in order of appearance.
+        """
+        called = set()
+        components = []
+        hooks = []
+        for match in _USAGE_RE.finditer(content):
+            index, groups = _alternative(match, _USAGE_SPANS)
+            if index == _USAGE_HOOK:
+                hooks.append(groups[0])
                 continue
+            text = match.group(0)
+            if index == _USAGE_CALL:
+                called.add(groups[0])
+            else:
+                components.append(groups[0])
+                if text.find(b'.') != -1:
+                    called.update(_CALL_RE.findall(text))
+            if text.find(b'use') != -1:
+                hooks.extend(_HOOK_RE.findall(text))
+        return called, components, hooks
+
+    def _process_imports(self, content: bytes, file_node: str):
+        """Process import, require and re-export statements in the content."""
+        if content.find(b'import') == -1 and content.find(b'require') == -1 and content.find(b'export') == -1:
+            return
+
+        for match in _IMPORT_RE.finditer(content):
+            index, groups = _alternative(match, _IMPORT_SPANS)
+            imp = _decode(groups[-1])
+
+            import_entities = []
+            if index == 0:
+                default, namespace, destructured, _ = groups
+                for name in (default, namespace):
+                    if name:
+                        import_entities.append(_decode(name))
+                if destructured:
+                    # Process each destructured import.
+                    import_entities.extend(_decode(name) for name in _DESTRUCTURED_NAME_RE.findall(destructured))
 
             imported_file = self._resolve_import_path(file_node, imp)
             if imported_file:
-                if not self.graph.has_node(imported_file):
-                    self.graph.add_node(imported_file, type="file")
-                self.graph.add_edge(file_node, imported_file, relation="IMPORTS")
+                self._add_node(imported_file, type="file")
+                self._add_edge(file_node, imported_file, "IMPORTS")
 
                 # Create nodes for imported entities and link them.
                 for entity in import_entities:
-                    entity_node = f"Entity: {entity}"
-                    if not self.graph.has_node(entity_node):
-                        self.graph.add_node(entity_node, type="entity", name=entity)
-                    self.graph.add_edge(file_node, entity_node, relation="USES_ENTITY")
-                    # If the entity is exported from the imported file, link it.
-                    if entity in self.exports_map.get(imported_file, set()):
-                        self.graph.add_edge(entity_node, imported_file, relation="DEFINED_IN")
+                    entity_node = _label("Entity: ", entity)
+                    self._add_node(entity_node, type="entity", name=entity)
+                    self._add_edge(file_node, entity_node, "USES_ENTITY")
+                    # Linked to the exporting file once all files are analyzed.
+                    self._imported_entities.append((entity, entity_node, imported_file))
 
                 # Update import count.
                 self.total_imports += 1
@@ -259,7 +934,22 @@ class JSCodeKnowledgeGraph:
                 self.total_dependencies.add(imp)
 
     def _resolve_import_path(self, current_file: str, import_path: str) -> Optional[str]:
-        """Resolve the import path to an actual file."""
+        """Resolve the import path to an actual file.
+
+        Resolution only depends on the importing file's directory, so results
+        are memoized per (directory, import path).
+        """
+        key = (os.path.dirname(current_file), import_path)
+        try:
+            return self._resolve_cache[key]
+        except KeyError:
+            pass
+        resolved = self._resolve_uncached(current_file, import_path)
+        self._resolve_cache[key] = resolved
+        return resolved
+
+    def _resolve_uncached(self, current_file: str, import_path: str) -> Optional[str]:
+        """Resolve the import path to an actual file, probing the file system."""
         try:
             # Remove 'File: ' prefix if present.
             if current_file.startswith("File: "):
@@ -302,7 +992,7 @@ class JSCodeKnowledgeGraph:
             # First try exact path.
             for ext in extensions:
                 full_path = resolved_path + ext
-                if os.path.isfile(full_path):
+                if self._is_file(full_path):
                     relative_path = os.path.relpath(full_path, self.directory)
                     if self._is_in_ignored_directory(relative_path):
                         return None
@@ -313,123 +1003,100 @@ class JSCodeKnowledgeGraph:
             for ext in extensions:
                 if ext.startswith("/"):
                     full_path = parent_dir + ext
-                    if os.path.isfile(full_path):
+                    if self._is_file(full_path):
                         relative_path = os.path.relpath(full_path, self.directory)
                         if self._is_in_ignored_directory(relative_path):
                             return None
                         return f"File: {relative_path}"
 
-            # Try directory index.
-            if os.path.isdir(resolved_path):
-                for ext in extensions:
-                    if ext.startswith("/"):
-                        full_path = resolved_path + ext
-                        if os.path.isfile(full_path):
-                            relative_path = os.path.relpath(full_path, self.directory)
-                            if self._is_in_ignored_directory(relative_path):
-                                return None
-                            return f"File: {relative_path}"
-
             return None
 
         except Exception as e:
             print(f"Error resolving import path {import_path}: {str(e)}", file=sys.stderr)
             return None
 
+    def _is_file(self, path: str) -> bool:
+        """Check whether path is a file, using cached directory listings.
+
+        One scandir per directory replaces the ``os.path.isfile`` probe for
+        every candidate extension.
+        """
+        directory, name = os.path.split(path)
+        # A bare name, e.g. after normpath of "./b.js", lies in the current directory.
+        directory = directory or os.curdir
+        try:
+            files = self._dir_files_cache[directory]
+        except KeyError:
+            try:
+                with os.scandir(directory) as it:
+                    files = frozenset(entry.name for entry in it if entry.is_file())
+            except OSError:
+                files = _EMPTY_SET
+            self._dir_files_cache[directory] = files
+        return name in files
+
     def _is_in_ignored_directory(self, relative_path: str) -> bool:
         """Check if the relative path is inside any ignored directory."""
-        path_parts = relative_path.split(os.sep)
-        for part in path_parts:
-            if part in self.ignored_directories:
-                return True
-        return False
+        return not self.ignored_directories.isdisjoint(relative_path.split(os.sep))
 
-    def _process_classes(self, content: str, file_node: str):
+    def _process_classes(self, content: bytes, file_node: str):
         """Process class declarations including React components and interfaces."""
-        class_patterns = [
-            # Regular classes.
-            r'(?:export\s+)?(?:abstract\s+)?class\s+(\w+)(?:\s+extends\s+[^{]+)?\s*{([^}]*)}',
-            # Interfaces.
-            r'(?:export\s+)?interface\s+(\w+)(?:\s+extends\s+[^{]+)?\s*{([^}]*)}',
-            # Type aliases.
-            r'(?:export\s+)?type\s+(\w+)\s*=\s*{([^}]*)}',
-            # React components as classes.
-            r'(?:export\s+)?class\s+(\w+)\s+extends\s+(?:React\.)?Component\s*[^{]*{([^}]*)}',
-            # Pure components.
-            r'(?:export\s+)?class\s+(\w+)\s+extends\s+(?:React\.)?PureComponent\s*[^{]*{([^}]*)}',
-        ]
-
-        for pattern in class_patterns:
-            for match in re.finditer(pattern, content, re.DOTALL):
-                try:
-                    class_name = match.group(1)
-                    class_node = f"Class: {class_name} ({file_node})"
+        if content.find(b'class') == -1 and content.find(b'interface') == -1 and content.find(b'type') == -1:
+            return
 
-                    if not self.graph.has_node(class_node):
-                        self.graph.add_node(
-                            class_node,
-                            type="class",
-                            name=class_name,
-                            is_react_component="Component" in pattern or "PureComponent" in pattern,
-                        )
+        for index, groups, exported in _find_classes(content):
+            try:
+                class_name = _decode(groups[0])
+                class_node = f"Class: {class_name} ({file_node})"
+
+                self._add_node(
+                    class_node,
+                    type="class",
+                    name=class_name,
+                    is_react_component=_CLASS_IS_REACT[index],
+                )
 
-                    self.graph.add_edge(file_node, class_node, relation="DEFINES")
+                self._add_edge(file_node, class_node, "DEFINES")
 
-                    class_body = match.group(2) if len(match.groups()) > 1 else ""
-                    if class_body:
-                        self._process_class_methods(class_body, class_node)
+                class_body = groups[1]
+                if class_body:
+                    self._process_class_methods(class_body, class_node)
 
-                    # If exported, add to exports map.
-                    if 'export' in match.group(0):
-                        if file_node not in self.exports_map:
-                            self.exports_map[file_node] = set()
-                        self.exports_map[file_node].add(class_name)
+                # If exported, add to exports map.
+                if exported:
+                    self.exports_map.setdefault(file_node, set()).add(class_name)
 
-                    self.total_classes += 1
+                self.total_classes += 1
 
-                except Exception as e:
-                    print(f"Error processing class {class_name}: {str(e)}", file=sys.stderr)
+            except Exception as e:
+                print(f"Error processing class {class_name}: {str(e)}", file=sys.stderr)
 
-    def _process_class_methods(self, class_body: str, class_node: str):
+    def _process_class_methods(self, class_body: bytes, class_node: str):
         """Process methods within a class including React lifecycle methods."""
-        method_pattern = (
-            r'(?:async\s+)?'                           # async modifier
-            r'(?:static\s+)?'                          # static modifier
-            r'(?:private\s+|protected\s+|public\s+)?'  # access modifiers
-            r'(?:get\s+|set\s+)?'                      # getter/setter
-            r'(\w+)'                                   # method name
-            r'\s*'
-            r'(?:<[^>]*>)?'                            # generic type parameters
-            r'\s*'
-            r'\((.*?)\)'                               # parameters
-            r'(?:\s*:\s*([^{;]*))?'                    # return type
-        )
-
         lifecycle_methods = {
             'componentDidMount', 'componentDidUpdate', 'componentWillUnmount',
             'shouldComponentUpdate', 'getSnapshotBeforeUpdate', 'componentDidCatch',
             'getDerivedStateFromProps', 'getDerivedStateFromError', 'render',
         }
 
-        for match in re.finditer(method_pattern, class_body):
+        for match in _METHOD_RE.finditer(class_body):
             try:
-                method_name = match.group(1)
-                parameters = match.group(2).strip() if match.group(2) else ""
-                return_type = match.group(3).strip() if match.group(3) else None
+                method_name = _decode(match.group(1))
+                parameters = _decode(match.group(2)).strip() if match.group(2) else ""
+                return_type = _decode(match.group(3)).strip() if match.group(3) else None
 
                 method_node = f"Function: {method_name} ({class_node})"
 
-                if not self.graph.has_node(method_node):
-                    self.graph.add_node(
-                        method_node,
-                        type="function",
-                        name=method_name,
-                        parameters=self._parse_parameters(parameters),
-                        return_type=return_type,
-                        is_lifecycle_method=method_name in lifecycle_methods,
-                    )
+                self._add_node(
+                    method_node,
+                    type="function",
+                    name=method_name,
+                    parameters=self._parse_parameters(parameters),
+                    return_type=return_type,
+                    is_lifecycle_method=method_name in lifecycle_methods,
+                )
 
-                self.graph.add_edge(class_node, method_node, relation="HAS_FUNCTION")
+                self._add_edge(class_node, method_node, "HAS_FUNCTION")
 
                 # Track class methods.
                 if class_node not in self.class_methods:
@@ -446,120 +1113,97 @@ class JSCodeKnowledgeGraph:
             except Exception as e:
                 print(f"Error processing method {method_name}: {str(e)}", file=sys.stderr)
 
-    def _process_functions(self, content: str, file_node: str):
-        """Process standalone functions including React hooks and components."""
-        function_patterns = [
-            # Regular functions.
-            r'(?:export\s+)?(?:async\s+)?function\s*(?:<[^>]*>)?\s*(\w+)\s*\((.*?)\)(?:\s*:\s*([^{;]*))?',
-            # Arrow functions with explicit type.
-            r'(?:export\s+)?(?:const|let|var)\s+(\w+)\s*:\s*(?:React\.)?(?:FC|FunctionComponent|ComponentType)[^=]*=\s*(?:async\s*)?\((.*?)\)(?:\s*:\s*([^{;]*))?',
-            # Arrow functions.
-            r'(?:export\s+)?(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s*)?\((.*?)\)(?:\s*:\s*([^{;]*))?\s*=>',
-            # React components.
-            r'(?:export\s+)?(?:const|let|var)\s+(\w+)\s*=\s*React\.memo\(',
-            # React forwardRef.
-            r'(?:export\s+)?(?:const|let|var)\s+(\w+)\s*=\s*React\.forwardRef\(',
-            # Custom hooks.
-            r'(?:export\s+)?(?:function|const|let|var)\s+(use\w+)',
-            # Higher-order components.
-            r'(?:export\s+)?(?:const|let|var)\s+(\w+)\s*=\s*with\w+\(',
-        ]
+    def _process_functions(self, content: bytes, file_node: str, called: Set[bytes]):
+        """Process standalone functions including React hooks and components.
 
-        for pattern in function_patterns:
-            matches = re.finditer(pattern, content, re.DOTALL)
-            for match in matches:
-                try:
-                    func_name = match.group(1)
-
-                    # Skip if this is a method call rather than a definition.
-                    if re.search(r'\.\s*' + func_name + r'\s*\(', content):
-                        continue
-
-                    # Get parameters and return type if available.
-                    parameters = match.group(2).strip() if len(match.groups()) > 1 and match.group(2) else ""
-                    return_type = match.group(3).strip() if len(match.groups()) > 2 and match.group(3) else None
-
-                    func_node = f"Function: {func_name} ({file_node})"
-
-                    # Determine function type.
-                    is_hook = func_name.startswith('use')
-                    is_component = any(
-                        suffix in func_name for suffix in ['Page', 'Component', 'View', 'Layout']
-                    )
-
-                    if not self.graph.has_node(func_node):
-                        self.graph.add_node(
-                            func_node,
-                            type="function",
-                            name=func_name,
-                            parameters=self._parse_parameters(parameters),
-                            return_type=return_type,
-                            is_hook=is_hook,
-                            is_component=is_component,
-                        )
-
-                    self.graph.add_edge(file_node, func_node, relation="DEFINES")
-
-                    # Track parameters and return types.
-                    self.function_params[func_node] = self._parse_parameters(parameters)
-                    if return_type:
-                        self.function_returns[func_node] = return_type
-
-                    # If exported, add to exports map.
-                    if 'export' in match.group(0):
-                        if file_node not in self.exports_map:
-                            self.exports_map[file_node] = set()
-                        self.exports_map[file_node].add(func_name)
-
-                    if is_component:
-                        self.total_components += 1
-                    elif is_hook:
-                        self.total_hooks += 1
-                    else:
-                        self.total_functions += 1
+        ``called`` holds the names invoked as methods anywhere in the file,
+        e.g. obj.name(...).
+        """
+        for _, groups, exported in _find_functions(content):
+            try:
+                func_name = _decode(groups[0])
 
-                except Exception as e:
-                    print(f"Error processing function {func_name}: {str(e)}", file=sys.stderr)
+                # Skip if this is a method call rather than a definition.
+                if groups[0] in called:
+                    continue
 
-    def _process_jsx_components(self, content: str, file_node: str):
-        """Process JSX/TSX component usage within files."""
-        # Pattern to match JSX component usage.
-        component_pattern = r'<([A-Z]\w+)(?:\s+(?:{[^}]*}|"[^"]*"|\'[^\']*\'|[^>])*)?/?>'
+                # Get parameters and return type if available.
+                parameters = _decode(groups[1]).strip() if len(groups) > 1 and groups[1] else ""
+                return_type = _decode(groups[2]).strip() if len(groups) > 2 and groups[2] else None
+
+                func_node = f"Function: {func_name} ({file_node})"
+
+                # Determine function type.
+                is_hook = func_name.startswith('use')
+                is_component = any(
+                    suffix in func_name for suffix in ['Page', 'Component', 'View', 'Layout']
+                )
+
+                self._add_node(
+                    func_node,
+                    type="function",
+                    name=func_name,
+                    parameters=self._parse_parameters(parameters),
+                    return_type=return_type,
+                    is_hook=is_hook,
+                    is_component=is_component,
+                )
+
+                self._add_edge(file_node, func_node, "DEFINES")
 
-        for match in re.finditer(component_pattern, content):
+                # Track parameters and return types.
+                self.function_params[func_node] = self._parse_parameters(parameters)
+                if return_type:
+                    self.function_returns[func_node] = return_type
+
+                # If exported, add to exports map.
+                if exported:
+                    self.exports_map.setdefault(file_node, set()).add(func_name)
+
+                if is_component:
+                    self.total_components += 1
+                elif is_hook:
+                    self.total_hooks += 1
+                else:
+                    self.total_functions += 1
+
+            except Exception as e:
+                print(f"Error processing function {func_name}: {str(e)}", file=sys.stderr)
+
+    def _process_jsx_components(self, components: List[bytes], file_node: str):
+        """Process JSX/TSX component usage within files."""
+        # Each component is recorded once per file, however often it is used.
+        for name in dict.fromkeys(components):
             try:
-                component_name = match.group(1)
-                component_node = f"Component: {component_name}"
+                component_name = _decode(name)
+                component_node = _label("Component: ", component_name)
 
-                if not self.graph.has_node(component_node):
-                    self.graph.add_node(
-                        component_node,
-                        type="component",
-                        name=component_name,
-                    )
+                self._add_node(
+                    component_node,
+                    type="component",
+                    name=component_name,
+                )
 
-                self.graph.add_edge(file_node, component_node, relation="USES_COMPONENT")
+                self._add_edge(file_node, component_node, "USES_COMPONENT")
 
             except Exception as e:
                 print(f"Error processing JSX component {component_name}: {str(e)}", file=sys.stderr)
 
-    def _process_hooks(self, content: str, file_node: str):
+    def _process_hooks(self, hooks: List[bytes], file_node: str):
         """Process React hook usage within components."""
-        hook_pattern = r'(use\w+)\s*\('
-
-        for match in re.finditer(hook_pattern, content):
+        # Each hook is recorded once per file, however often it is called.
+        for name in dict.fromkeys(hooks):
             try:
-                hook_name = match.group(1)
-                hook_node = f"Hook: {hook_name}"
+                hook_name = _decode(name)
+                hook_node = _label("Hook: ", hook_name)
 
-                if not self.graph.has_node(hook_node):
-                    self.graph.add_node(
-                        hook_node,
-                        type="hook",
-                        name=hook_name,
-                    )
+                self._add_node(
+                    hook_node,
+                    type="hook",
+                    name=hook_name,
+                )
 
-                self.graph.add_edge(file_node, hook_node, relation="USES_HOOK")
+                self._add_edge(file_node, hook_node, "USES_HOOK")
 
             except Exception as e:
                 print(f"Error processing hook {hook_name}: {str(e)}", file=sys.stderr)
@@ -569,39 +1213,40 @@ class JSCodeKnowledgeGraph:
         if not params_str:
             return []
 
-        params = []
+        # Split on commas outside brackets, jumping from one bracket or comma
+        # to the next rather than walking every character.
+        pieces = []
         depth = 0
-        current_param = ""
-
-        for char in params_str:
+        start = 0
+        for match in _PARAM_TOKEN_RE.finditer(params_str):
+            char = match.group()
             if char in '{[(':
                 depth += 1
             elif char in '}])':
                 depth -= 1
-            elif char == ',' and depth == 0:
-                if current_param.strip():
-                    params.append(self._parse_single_parameter(current_param.strip()))
-                current_param = ""
-                continue
-            current_param += char
-
-        if current_param.strip():
-            params.append(self._parse_single_parameter(current_param.strip()))
-
-        return params
+            elif depth == 0:
+                pieces.append(params_str[start:match.start()])
+                start = match.end()
+        pieces.append(params_str[start:])
+
+        return [
+            self._parse_single_parameter(piece.strip())
+            for piece in pieces
+            if piece.strip()
+        ]
 
     def _parse_single_parameter(self, param: str) -> Dict[str, Any]:
         """Parse a single parameter with its type and default value."""
         param_dict: Dict[str, Any] = {"name": param}
 
         # Handle TypeScript type annotations.
-        type_match = re.match(r'(?:readonly\s+)?(\w+)\s*(?:\?|!)?:\s*([^=]+)', param)
+        type_match = _PARAM_TYPE_RE.match(param)
         if type_match:
             param_dict["name"] = type_match.group(1)
             param_dict["type"] = type_match.group(2).strip()
 
         # Handle default values.
-        default_match = re.match(r'(\w+)\s*=\s*(.+)', param)
+        default_match = _PARAM_DEFAULT_RE.match(param)
         if default_match:
             param_dict["name"] = default_match.group(1)
             param_dict["default"] = default_match.group(2)
@@ -612,68 +1257,57 @@ class JSCodeKnowledgeGraph:
 
         return param_dict
 
-    def _process_exports(self, content: str, file_node: str):
+    def _process_exports(self, content: bytes, file_node: str):
         """Process export statements including default and named exports."""
-        export_patterns = [
-            # Named exports.
-            r'export\s+(?:const|let|var|function|class)\s+(\w+)',
-            # Default exports.
-            r'export\s+default\s+(?:class\s+)?(\w+)',
-            # Named exports list.
-            r'export\s*{\s*((?:\w+(?:\s+as\s+\w+)?(?:\s*,\s*)?)+)\s*}',
-            # Re-exports.
-            r'export\s*\*\s*from\s*[\'"]([^\'"]+)[\'"]',
-            # Type exports.
-            r'export\s+type\s+(\w+)',
-            # Export functions (e.g., export function funcName() {})
-            r'export\s+function\s+(\w+)\s*\(',
-        ]
+        if content.find(b'export') == -1:
+            return
 
-        for pattern in export_patterns:
-            for match in re.finditer(pattern, content):
+        for pattern, is_reexport in _EXPORT_PATTERNS:
+            for match in pattern.finditer(content):
                 try:
-                    if 'from' in pattern:
+                    if is_reexport:
                         # Handle re-exports.
-                        module_path = match.group(1)
+                        module_path = _decode(match.group(1))
                         # Resolve module path to file.
                         exported_file = self._resolve_import_path(file_node, module_path)
                         if exported_file:
-                            if not self.graph.has_node(exported_file):
-                                self.graph.add_node(exported_file, type="file")
-                            self.graph.add_edge(file_node, exported_file, relation="RE_EXPORTS")
+                            self._add_node(exported_file, type="file")
+                            self._add_edge(file_node, exported_file, "RE_EXPORTS")
                     else:
-                        exports = match.group(1).split(',')
+                        exports = _decode(match.group(1)).split(',')
                         for export in exports:
                             export_name = export.strip().split(' as ')[0].strip()
-                            export_node = f"Entity: {export_name}"
+                            export_node = _label("Entity: ", export_name)
 
-                            if not self.graph.has_node(export_node):
-                                self.graph.add_node(
-                                    export_node,
-                                    type="export",
-                                    name=export_name,
-                                )
+                            self._add_node(
+                                export_node,
+                                type="export",
+                                name=export_name,
+                            )
 
-                            self.graph.add_edge(file_node, export_node, relation="EXPORTS")
+                            self._add_edge(file_node, export_node, "EXPORTS")
 
                             # Add to exports map.
-                            if file_node not in self.exports_map:
-                                self.exports_map[file_node] = set()
-                            self.exports_map[file_node].add(export_name)
+                            self.exports_map.setdefault(file_node, set()).add(export_name)
 
                             self.total_exports += 1
 
                 except Exception as e:
                     print(f"Error processing export: {str(e)}", file=sys.stderr)
 
-    def _process_dependency_file(self, file_path: str):
-        """Process dependency files like package.json, package-lock.json, yarn.lock, pnpm-lock.yaml."""
+    def _process_dependency_file(self, file_path: str, content: Optional[bytes] = None):
+        """Process dependency files like package.json, package-lock.json, yarn.lock, pnpm-lock.yaml.
+
+        ``content`` is the file as already read by `_read_dependency`, if it was.
+        """
         try:
             if file_path in self.analyzed_files:
                 return
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            # Read as bytes: the JSON parser works on them without a decode.
+            if content is None:
+                with open(file_path, "rb") as f:
+                    content = f.read()
 
             relative_path = os.path.relpath(file_path, self.directory)
             file_node = f"Dependency File: {relative_path}"
@@ -682,45 +1316,48 @@ class JSCodeKnowledgeGraph:
             self.analyzed_files.add(file_path)
 
             # Add file node if it doesn't exist.
-            if not self.graph.has_node(file_node):
-                self.graph.add_node(file_node, type="dependency_file", path=relative_path)
-
-            # Process dependencies
-            if file_path.endswith("package.json"):
-                data = json.loads(content)
-                dependencies = data.get("dependencies", {})
-                dev_dependencies = data.get("devDependencies", {})
-
-                for dep in {**dependencies, **dev_dependencies}:
-                    dep_node = f"Dependency: {dep}"
-                    if not self.graph.has_node(dep_node):
-                        self.graph.add_node(dep_node, type="dependency", name=dep)
-                    self.graph.add_edge(file_node, dep_node, relation="HAS_DEPENDENCY")
-
-                    self.total_dependencies.add(dep)
-
-            elif file_path.endswith(("package-lock.json", "yarn.lock", "pnpm-lock.yaml")):
-                # For lock files, parse package-lock.json
-                if file_path.endswith("package-lock.json"):
-                    data = json.loads(content)
-                    dependencies = data.get("dependencies", {})
-                    for dep in dependencies:
-                        dep_node = f"Dependency: {dep}"
-                        if not self.graph.has_node(dep_node):
-                            self.graph.add_node(dep_node, type="dependency", name=dep)
-                        self.graph.add_edge(file_node, dep_node, relation="HAS_LOCKED_DEPENDENCY")
-
-                        self.total_dependencies.add(dep)
-                else:
-                    # For yarn.lock and pnpm-lock.yaml, parsing is complex; skipping for now.
-                    pass
+            self._add_node(file_node, type="dependency_file", path=relative_path)
+
+            # Process dependencies, reusing those of an identical file.
+            name = os.path.basename(file_path)
+            parse = _DEPENDENCY_PARSERS.get(name)
+            if parse is None:
+                return
+            key = (hashlib.blake2b(content, digest_size=16).digest(), name)
+            if key in self._dependency_cache:
+                parsed = self._dependency_cache[key]
+            else:
+                parsed = self._dependency_cache[key] = parse(content)
+            self._add_dependencies(file_node, *parsed)
 
         except Exception as e:
             print(f"Error processing dependency file {file_path}: {str(e)}", file=sys.stderr)
 
-    def save_graph(self, output_path: str):
-        """Save the knowledge graph in standard JSON format."""
-        data = json_graph.node_link_data(self.graph)
+    def _node_records(self):
+        """Yield the nodes as ``node_link_data`` lays them out."""
+        for label, node_type, attrs in zip(self._node_labels, self._node_types, self._node_attrs):
+            yield {"type": node_type, **attrs, "id": label}
+
+    def _link_records(self):
+        """Yield the edges as ``node_link_data`` lays them out."""
+        labels = self._node_labels
+        relations = self._relations
+        for u, v, relation in self._edge_ids():
+            yield {"relation": relations[relation], "source": labels[u], "target": labels[v]}
+
+    def save_graph(self, output_path: str, pretty: bool = False):
+        """Save the knowledge graph in standard JSON format.
+
+        The graph is written in the node-link format of ``json_graph``, one
+        compact node or link record per line, rather than first being copied
+        into a nested structure and serialized whole. With ``pretty`` the
+        whole document is built and indented instead.
+        """
+        # The layout (and key names) of node_link_data, from an empty graph.
+        layout = json_graph.node_link_data(nx.DiGraph())
+        links_key = "edges" if "edges" in layout else "links"
+        streams = {"nodes": self._node_records(), links_key: self._link_records()}
+
         metadata = {
             "stats": {
                 "total_files": self.total_files,
@@ -738,11 +1375,58 @@ class JSCodeKnowledgeGraph:
             "class_methods": {k: list(v) for k, v in self.class_methods.items()},  
         }
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump({"graph": data, "metadata": metadata}, f, indent=2)
+        with open(output_path, "wb", buffering=_WRITE_BUFFER_BYTES) as f:
+            if pretty:
+                data = {**layout, **{key: list(records) for key, records in streams.items()}}
+                f.write(_json_dumps({"graph": data, "metadata": metadata}, pretty=True))
+                return
+
+            f.write(b'{"graph":{')
+            for i, (key, value) in enumerate(layout.items()):
+                if i:
+                    f.write(b",")
+                f.write(_json_dumps(key) + b":")
+                if key in streams:
+                    _write_records(f, streams[key])
+                else:
+                    f.write(_json_dumps(value))
+            f.write(b'},\n"metadata":')
+            f.write(_json_dumps(metadata))
+            f.write(b"}\n")
+
+    def write_graphml(self, output_path: str):
+        """Save the knowledge graph as GraphML, for viewers like Gephi or Cytoscape.
+
+        GraphML attributes are scalars, so lists such as parameters are stored
+        as JSON text, and unset attributes are left out.
+        """
+        labels = self._node_labels
+        relations = self._relations
+        graph = nx.DiGraph()
+        for label, node_type, attrs in zip(labels, self._node_types, self._node_attrs):
+            graph.add_node(label, type=node_type, **{
+                key: value if isinstance(value, (str, int, float, bool)) else json.dumps(value)
+                for key, value in attrs.items()
+                if value is not None
+            })
+        graph.add_edges_from(
+            (labels[u], labels[v], {"relation": relations[relation]})
+            for u, v, relation in self._edge_ids()
+        )
+        with open(output_path, "wb", buffering=_WRITE_BUFFER_BYTES) as f:
+            nx.write_graphml(graph, f)
+
+    def visualize_graph(self, graphml_path: str = "js_code_knowledge_graph.graphml"):
+        """Visualize the knowledge graph.
+
+        Graphs too large to draw legibly are written to ``graphml_path``
+        instead, to be explored in an external viewer.
+        """
+        if len(self._node_labels) > _MAX_DRAWN_NODES:
+            self.write_graphml(graphml_path)
+            print(f"Graph has {len(self._node_labels):,} nodes, too many to draw; saved it to {graphml_path} instead.")
+            return
 
-    def visualize_graph(self):
-        """Visualize the knowledge graph."""
         try:
             import matplotlib.pyplot as plt
 
@@ -759,21 +1443,29 @@ class JSCodeKnowledgeGraph:
                 "dependency": "#8A2BE2",  # Blue Violet
             }
 
-            # Set node colors
-            node_colors = [
-                color_map.get(self.graph.nodes[node].get("type", "file"), "lightgray")
-                for node in self.graph.nodes()
-            ]
+            graph = self._nx_view()
+
+            # Set node colors, reading the type column in node order and
+            # resolving each distinct type's color once.
+            type_colors = {
+                node_type: color_map.get(node_type, "lightgray")
+                for node_type in set(self._node_types)
+            }
+            node_colors = [type_colors[node_type] for node_type in self._node_types]
 
             # Create figure and axis explicitly
             fig, ax = plt.subplots(figsize=(20, 15))
 
-            # Calculate layout
-            pos = nx.spring_layout(self.graph, k=1.5, iterations=50)
+            # Calculate layout: Graphviz's multiscale sfdp scales to large graphs,
+            # otherwise fall back to NetworkX's force-directed layout.
+            try:
+                pos = nx.nx_agraph.graphviz_layout(graph, prog="sfdp")
+            except (ImportError, ValueError):
+                pos = nx.spring_layout(graph, k=1.5, iterations=50)
 
             # Draw the graph
             nx.draw(
-                self.graph,
+                graph,
                 pos,
                 ax=ax,
                 with_labels=True,
@@ -820,25 +1512,46 @@ class JSCodeKnowledgeGraph:
             print("Matplotlib is required for visualization. Install it using 'pip install matplotlib'.")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate a knowledge graph of a JavaScript/TypeScript codebase.",
+    )
+    parser.add_argument("codebase", help="path to the codebase directory")
+    parser.add_argument(
+        "-o", "--output",
+        default="js_code_knowledge_graph.json",
+        help="where to save the graph (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=None,
+        help="worker processes analyzing files; 1 analyzes them serially (default: number of CPUs)",
+    )
+    parser.add_argument("--visualize", action="store_true", help="draw the graph once it is saved")
+    parser.add_argument("--pretty", action="store_true", help="indent the saved JSON")
+    args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
     try:
         # Directory containing the JavaScript/TypeScript codebase.
         print("Code Knowledge Graph Generator")
         print("-----------------------------")
-        codebase_dir = input("Enter the path to the codebase directory: ").strip()
+        codebase_dir = args.codebase
 
         if not os.path.exists(codebase_dir):
             raise ValueError(f"Directory does not exist: {codebase_dir}")
 
-        output_file = "js_code_knowledge_graph.json"
+        output_file = args.output
 
         # Create and analyze the codebase.
         print("\nAnalyzing codebase...")
-        ckg = JSCodeKnowledgeGraph(directory=codebase_dir)
+        ckg = JSCodeKnowledgeGraph(directory=codebase_dir, max_workers=args.workers)
         ckg.analyze_codebase()
 
         # Save in standard format.
         print("\nSaving graph...")
-        ckg.save_graph(output_file)
+        ckg.save_graph(output_file, pretty=args.pretty)
         print(f"\nCode knowledge graph saved to {output_file}")
 
         # Display metadata stats
@@ -855,22 +1568,15 @@ if __name__ == "__main__":
         }
 
         # Calculate max length for padding
-        max_len = max(len(key) for key in stats.keys())
+        max_len = max(map(len, stats))
 
         # Print stats in aligned columns
-        for key, value in stats.items():
-            print(f"{key:<{max_len + 2}}: {value:,}")
+        print("\n".join(f"{key:<{max_len + 2}}: {value:,}" for key, value in stats.items()))
 
         # Optional visualization.
-        while True:
-            visualize = input("\nWould you like to visualize the graph? (yes/no): ").strip().lower()
-            if visualize in ["yes", "no"]:
-                break
-            print("Invalid choice. Please enter yes or no.")
-
-        if visualize == "yes":
+        if args.visualize:
             print("\nGenerating visualization...")
-            ckg.visualize_graph()
+            ckg.visualize_graph(os.path.splitext(output_file)[0] + ".graphml")
 
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")